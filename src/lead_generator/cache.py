@@ -0,0 +1,106 @@
+import hashlib
+import importlib.util
+from typing import Any, Optional, Tuple
+
+import diskcache
+
+# sentence-transformers é opcional: sem ele apenas o cache exato é usado. Ele só é
+# importado no primeiro embedding, pois carrega torch e transformers
+SEMANTIC_CACHE_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+CACHE_DIR = ".lead_cache"
+CACHE_TTL = 60 * 60  # 1 hora
+SIMILARITY_THRESHOLD = 0.92
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+def normalize_inputs(inputs: dict) -> Tuple[Tuple[str, str], ...]:
+    """Normaliza os inputs para que variações de caixa e espaços gerem a mesma chave"""
+    return tuple(sorted((key, str(value).strip().lower()) for key, value in inputs.items()))
+
+
+def make_key(*parts: Any) -> str:
+    """Gera uma chave estável a partir das partes fornecidas"""
+    return hashlib.blake2b(repr(parts).encode()).hexdigest()
+
+
+class ResponseCache:
+    """Cache de respostas em dois níveis: exato e semântico.
+
+    O nível exato usa os inputs normalizados como chave. O nível semântico
+    compara o embedding do tópico (por padrão, a indústria) com os tópicos já
+    armazenados que tenham os demais inputs iguais, e reaproveita a resposta
+    quando a similaridade de cosseno atinge o limiar configurado.
+    """
+
+    _model = None
+
+    def __init__(self, directory: str = CACHE_DIR, ttl: int = CACHE_TTL,
+                 threshold: float = SIMILARITY_THRESHOLD, topic_field: str = "industry"):
+        self.directory = directory
+        self.ttl = ttl
+        self.threshold = threshold
+        self.topic_field = topic_field
+        self._disk = None
+
+    def get(self, inputs: dict) -> Optional[Any]:
+        """Retorna a resposta em cache para os inputs, se houver"""
+        normalized = normalize_inputs(inputs)
+        value = self._get(make_key("exact", normalized))
+        if value is not None or not SEMANTIC_CACHE_AVAILABLE:
+            return value
+
+        topic, partition = self._split_topic(normalized)
+        if not topic:
+            return None
+        embedding = self._embed(topic)
+        best_key, best_score = None, self.threshold
+        for stored_key, stored_embedding in self._get(make_key("semantic", partition)) or []:
+            score = sum(a * b for a, b in zip(embedding, stored_embedding))
+            if score >= best_score:
+                best_key, best_score = stored_key, score
+        return self._get(best_key) if best_key else None
+
+    def set(self, inputs: dict, value: Any) -> None:
+        """Armazena a resposta para os inputs"""
+        normalized = normalize_inputs(inputs)
+        key = make_key("exact", normalized)
+        self._set(key, value)
+
+        if SEMANTIC_CACHE_AVAILABLE:
+            topic, partition = self._split_topic(normalized)
+            if topic:
+                index_key = make_key("semantic", partition)
+                # Descarta do índice as entradas cuja resposta já expirou
+                index = [(k, e) for k, e in self._get(index_key) or [] if k != key and self._get(k) is not None]
+                index.append((key, self._embed(topic)))
+                self._set(index_key, index)
+
+    def _split_topic(self, normalized: Tuple[Tuple[str, str], ...]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        """Separa o tópico comparado semanticamente dos inputs que devem coincidir"""
+        topic = dict(normalized).get(self.topic_field, "")
+        partition = tuple(item for item in normalized if item[0] != self.topic_field)
+        return topic, partition
+
+    def _embed(self, text: str) -> list:
+        """Gera o embedding normalizado do texto"""
+        if ResponseCache._model is None:
+            from sentence_transformers import SentenceTransformer
+            ResponseCache._model = SentenceTransformer(EMBEDDING_MODEL)
+        return ResponseCache._model.encode(text, normalize_embeddings=True).tolist()
+
+    def _backend(self) -> diskcache.Cache:
+        """Abre o cache em disco na primeira utilização"""
+        if self._disk is None:
+            self._disk = diskcache.Cache(self.directory)
+        return self._disk
+
+    def _get(self, key: str) -> Optional[Any]:
+        return self._backend().get(key)
+
+    def _set(self, key: str, value: Any) -> None:
+        self._backend().set(key, value, expire=self.ttl)
+
+
+# Instância compartilhada entre todos os LeadGenerator do processo
+response_cache = ResponseCache()
@@ -1,6 +1,10 @@
+import asyncio
+import importlib.util
 import os
 import sys
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 # Configuração específica para Streamlit Cloud
 os.environ["ALLOW_RESET"] = "TRUE"
@@ -11,183 +15,197 @@ os.environ["ANONYMIZED_TELEMETRY"] = "FALSE"
 # Verificar se está no Streamlit
 IS_STREAMLIT = 'streamlit' in sys.modules or 'streamlit' in str(sys.argv)
 
-# Tentar importar CrewAI
-CREWAI_AVAILABLE = False
-IMPORT_ERROR = None
-
-try:
-    from crewai import Agent, Crew, Process, Task
-    from crewai.project import CrewBase, agent, crew, task
-    from crewai_tools import SerperDevTool, ScrapeWebsiteTool
-    CREWAI_AVAILABLE = True
-    print("✅ CrewAI importado com sucesso!")
-except Exception as e:
-    IMPORT_ERROR = str(e)
-    print(f"❌ Erro ao importar CrewAI: {e}")
-    
-    # Se estiver no Streamlit, importar para mostrar erro na interface
-    if IS_STREAMLIT:
-        try:
-            import streamlit as st
-        except ImportError:
-            pass
+# CrewAI é importado sob demanda (ver _lazy_import_crewai): a importação traz
+# chromadb, litellm, openai etc. e só é paga quando um LeadGenerator é criado
+CREWAI_AVAILABLE = importlib.util.find_spec("crewai") is not None
+IMPORT_ERROR = None if CREWAI_AVAILABLE else "No module named 'crewai'"
+_crew_class = None
 
 # Imports sempre disponíveis
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .cache import make_key, normalize_inputs, response_cache
+from .retry import retry_transient
+
+# Modelo padrão dos agentes e configuração do LLM local (LLM_PROVIDER=local)
+DEFAULT_LLM_MODEL = "gpt-4o-mini"
+LOCAL_LLM_MODEL = os.getenv("LOCAL_LLM_MODEL", "ollama/llama3.1")
+LOCAL_LLM_BASE_URL = os.getenv("LOCAL_LLM_BASE_URL", "http://localhost:11434")
+
+def uses_local_llm() -> bool:
+    """Retorna True se os agentes devem usar um LLM local em vez da API remota"""
+    return os.getenv("LLM_PROVIDER", "").lower() == "local"
+
+# Execuções em andamento, por inputs normalizados: pedidos idênticos simultâneos
+# aguardam a mesma execução em vez de disparar outro crew
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
 
 # Carregar variáveis de ambiente
 load_dotenv()
 
 # Schema sempre disponível
 class LeadOutput(BaseModel):
-    company_name: Optional[str] = Field(description="The name of the company")
-    annual_revenue: Optional[str] = Field(description="Annual revenue of the company")
-    location: Optional[Dict[str, str]] = Field(description="Location with city and country fields")
-    website_url: Optional[str] = Field(description="Company website URL")
-    review: Optional[str] = Field(description="Description of what the company does")
-    num_employees: Optional[int] = Field(description="Number of employees")
-    key_decision_makers: Optional[List[Dict[str, str]]] = Field(description="List of key people with their LinkedIn profiles")
-    score: Optional[int] = Field(description="Fit score on a scale of 1-10")
-
-# Tools (apenas se CrewAI estiver disponível)
-if CREWAI_AVAILABLE:
-    search_tool = SerperDevTool()
-    scrape_tool = ScrapeWebsiteTool()
+    model_config = ConfigDict(validate_assignment=False, arbitrary_types_allowed=True, frozen=False)
+
+    company_name: Optional[str] = Field(default=None, description="The name of the company")
+    annual_revenue: Optional[str] = Field(default=None, description="Annual revenue of the company")
+    location: Optional[Dict[str, str]] = Field(default=None, description="Location with city and country fields")
+    website_url: Optional[str] = Field(default=None, description="Company website URL")
+    review: Optional[str] = Field(default=None, description="Description of what the company does")
+    num_employees: Optional[int] = Field(default=None, description="Number of employees")
+    key_decision_makers: Optional[List[Dict[str, str]]] = Field(default=None, description="List of key people with their LinkedIn profiles")
+    score: Optional[int] = Field(default=None, description="Fit score on a scale of 1-10")
+
+def _lazy_import_crewai():
+    """Importa o CrewAI na primeira chamada e retorna a classe do crew (None se indisponível)"""
+    global CREWAI_AVAILABLE, IMPORT_ERROR, _crew_class
+    if _crew_class is None and IMPORT_ERROR is None:
+        try:
+            from .lead_crew import LeadGeneratorCrew
+            _crew_class = LeadGeneratorCrew
+            print("✅ CrewAI importado com sucesso!")
+        except Exception as e:
+            CREWAI_AVAILABLE = False
+            IMPORT_ERROR = str(e)
+            print(f"❌ Erro ao importar CrewAI: {e}")
+    return _crew_class
 
 # Classe principal com fallback
-if CREWAI_AVAILABLE:
-    @CrewBase
-    class LeadGenerator():
-        """LeadGenerator crew"""
-        agents_config = 'config/agents.yaml'
-        tasks_config = 'config/tasks.yaml'
-        
-        def __init__(self):
-            self.fallback_mode = False
-            super().__init__()
-        
-        @agent
-        def lead_generator(self) -> Agent:
-            return Agent(
-                config=self.agents_config['lead_generator'],
-                tools=[search_tool, scrape_tool],
-                verbose=True
-            )
-        
-        @agent
-        def contact_agent(self) -> Agent:
-            return Agent(
-                config=self.agents_config['contact_agent'],
-                tools=[search_tool, scrape_tool],
-                verbose=True
-            )
-        
-        @agent 
-        def lead_qualifier(self) -> Agent:
-            return Agent(
-                config=self.agents_config['lead_qualifier'],
-                verbose=True
-            )	
-        
-        @agent
-        def sales_manager(self) -> Agent:
-            return Agent(
-                config=self.agents_config['sales_manager'],
-                tools=[],
-                verbose=True
-            )	
-        
-        @task
-        def lead_generation_task(self) -> Task:
-            return Task(
-                config=self.tasks_config['lead_generation_task'],
-                output_pydantic=LeadOutput
-            )
-        
-        @task
-        def contact_research_task(self) -> Task:
-            return Task(
-                config=self.tasks_config['contact_research_task'],
-                context=[self.lead_generation_task()],
-            )
-        
-        @task
-        def lead_qualification_task(self) -> Task:
-            return Task(
-                config=self.tasks_config['lead_qualification_task'],
-                context=[self.lead_generation_task(), self.contact_research_task()],
-                output_pydantic=LeadOutput,
-            )
-        
-        @task
-        def sales_management_task(self) -> Task:
-            return Task(
-                config=self.tasks_config['sales_management_task'],
-                context=[self.lead_generation_task(), self.lead_qualification_task(), self.contact_research_task()],
-                output_pydantic=LeadOutput
-            )
-        
-        @crew
-        def crew(self) -> Crew:
-            """Creates the LeadGenerator crew"""
-            return Crew(
-                agents=self.agents,
-                tasks=self.tasks,
-                process=Process.sequential,
-                verbose=True,
-                usage_metrics={}
-            )
-        
-        def run(self, inputs: dict):
-            """Executa o crew com os inputs fornecidos"""
-            try:
-                return self.crew().kickoff(inputs=inputs)
-            except Exception as e:
-                print(f"Erro ao executar crew: {e}")
-                return self._fallback_response(inputs)
-        
-        def _fallback_response(self, inputs: dict) -> LeadOutput:
-            """Resposta de fallback quando há erro"""
-            return LeadOutput(
-                company_name="Erro na geração",
-                review=f"Houve um erro ao processar a solicitação: {inputs.get('topic', 'N/A')}",
-                score=0
-            )
-
-else:
-    # Classe de fallback quando CrewAI não está disponível
-    class LeadGenerator:
-        """LeadGenerator fallback class"""
-        
-        def __init__(self):
-            self.fallback_mode = True
+class LeadGenerator:
+    """LeadGenerator crew, em modo limitado quando CrewAI não está disponível"""
+    
+    def __init__(self):
+        crew_class = _lazy_import_crewai()
+        self.fallback_mode = crew_class is None
+        self._crew = None
+        self._crew_lock = threading.Lock()
+        if self.fallback_mode:
+            self._crew_base = None
             self._show_error_if_streamlit()
-        
-        def _show_error_if_streamlit(self):
-            """Mostra erro no Streamlit se aplicável"""
-            if IS_STREAMLIT:
-                try:
-                    import streamlit as st
-                    st.error("⚠️ CrewAI não está disponível neste ambiente")
-                    st.info("A aplicação está rodando em modo limitado")
-                    st.code(f"Erro técnico: {IMPORT_ERROR}")
-                    st.warning("Por favor, verifique as dependências do projeto")
-                except ImportError:
-                    pass
-        
-        def run(self, inputs: dict) -> LeadOutput:
-            """Execução em modo fallback"""
-            return LeadOutput(
-                company_name="Modo Limitado",
-                review=f"CrewAI indisponível. Tópico solicitado: {inputs.get('topic', 'N/A')}",
-                score=0,
-                location={"city": "N/A", "country": "N/A"}
-            )
-        
-        def crew(self):
-            """Crew mockado"""
+        else:
+            self._crew_base = crew_class()
+    
+    def _show_error_if_streamlit(self):
+        """Mostra erro no Streamlit se aplicável"""
+        if IS_STREAMLIT:
+            try:
+                import streamlit as st
+                st.error("⚠️ CrewAI não está disponível neste ambiente")
+                st.info("A aplicação está rodando em modo limitado")
+                st.code(f"Erro técnico: {IMPORT_ERROR}")
+                st.warning("Por favor, verifique as dependências do projeto")
+            except ImportError:
+                pass
+    
+    def crew(self):
+        """Cria um novo crew (None em modo fallback)"""
+        if self.fallback_mode:
             return None
+        return self._crew_base.crew()
+    
+    def get_crew(self):
+        """Retorna o crew desta instância, montando-o apenas uma vez"""
+        # Lock: run_many chama run() a partir de várias threads
+        with self._crew_lock:
+            if self._crew is None:
+                self._crew = self.crew()
+        return self._crew
+    
+    def run(self, inputs: dict, step_callback: Optional[Callable] = None):
+        """Executa o crew com os inputs fornecidos; step_callback recebe cada passo dos agentes"""
+        return self.run_with_cache_info(inputs, step_callback)[0]
+    
+    def run_with_cache_info(self, inputs: dict, step_callback: Optional[Callable] = None) -> Tuple[Any, bool]:
+        """Como run(), mas também indica se a resposta veio do cache ou de outra execução (sem gasto de tokens)"""
+        if self.fallback_mode:
+            return self._limited_mode_response(inputs), False
+
+        cached = response_cache.get(inputs)
+        if cached is not None:
+            return cached, True
+
+        key = make_key("run", normalize_inputs(inputs))
+        with _inflight_lock:
+            pending = _inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = _inflight[key] = Future()
+        if not owner:
+            return pending.result(), True
+
+        try:
+            result = self._kickoff(inputs, step_callback)
+            pending.set_result(result)
+            return result, False
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+    
+    def _kickoff(self, inputs: dict, step_callback: Optional[Callable] = None):
+        """Executa o crew e armazena a resposta em cache"""
+        try:
+            # Cada execução usa uma cópia do crew, pois a instância pode ser
+            # compartilhada entre sessões do Streamlit executando ao mesmo tempo
+            crew = self.get_crew().copy()
+            if step_callback is not None:
+                crew.step_callback = step_callback
+            # Falhas transitórias (429/5xx, timeouts) são repetidas antes de cair no fallback
+            result = retry_transient(crew.kickoff)(inputs=inputs)
+        except Exception as e:
+            print(f"Erro ao executar crew: {e}")
+            return self._fallback_response(inputs)
+        try:
+            response_cache.set(inputs, result)
+        except Exception as e:
+            print(f"Erro ao armazenar resposta em cache: {e}")
+        return result
+    
+    async def run_many(self, inputs_list: List[dict]) -> list:
+        """Executa um crew por conjunto de inputs, em paralelo"""
+        # Cada input passa por run() em sua própria thread: cache, deduplicação
+        # de execuções em andamento e retry valem também para o lote
+        crew_tasks = [
+            asyncio.create_task(asyncio.to_thread(self.run, inputs))
+            for inputs in inputs_list
+        ]
+        results = await asyncio.gather(*crew_tasks, return_exceptions=True)
+        outputs = []
+        for inputs, result in zip(inputs_list, results):
+            if isinstance(result, Exception):
+                print(f"Erro ao executar crew: {result}")
+                result = self._fallback_response(inputs)
+            outputs.append(result)
+        return outputs
+    
+    def run_batch(self, inputs_list: List[dict]) -> list:
+        """Versão síncrona de run_many"""
+        # Também com LLM local: o Ollama roda em outro processo e é chamado via HTTP,
+        # então as threads passam a espera fora do GIL como na API remota
+        return asyncio.run(self.run_many(inputs_list))
+    
+    def _fallback_response(self, inputs: dict) -> LeadOutput:
+        """Resposta de fallback quando há erro"""
+        # Valores fixos e válidos: não há o que validar
+        return LeadOutput.model_construct(
+            company_name="Erro na geração",
+            review=f"Houve um erro ao processar a solicitação: {inputs.get('topic', 'N/A')}",
+            score=0
+        )
+    
+    def _limited_mode_response(self, inputs: dict) -> LeadOutput:
+        """Execução em modo fallback"""
+        # Valores fixos e válidos: não há o que validar
+        return LeadOutput.model_construct(
+            company_name="Modo Limitado",
+            review=f"CrewAI indisponível. Tópico solicitado: {inputs.get('topic', 'N/A')}",
+            score=0,
+            location={"city": "N/A", "country": "N/A"}
+        )
 
 # Função utilitária para verificar disponibilidade
 def is_crewai_available() -> bool:
@@ -0,0 +1,106 @@
+from crewai import LLM, Agent, Crew, Process, Task
+from crewai.project import CrewBase, agent, crew, task
+
+from .crew import DEFAULT_LLM_MODEL, LOCAL_LLM_BASE_URL, LOCAL_LLM_MODEL, LeadOutput, uses_local_llm
+from .tools.scrape_tool import AsyncScrapeTool, PooledScrapeTool
+from .tools.search_tool import CachedSerperTool
+
+# Tools compartilhadas por todos os agentes
+search_tool = CachedSerperTool()
+scrape_tool = PooledScrapeTool()
+batch_scrape_tool = AsyncScrapeTool()
+
+
+def agent_llm():
+    """LLM dos agentes: modelo local quando LLM_PROVIDER=local, senão gpt-4o-mini"""
+    if uses_local_llm():
+        return LLM(model=LOCAL_LLM_MODEL, base_url=LOCAL_LLM_BASE_URL)
+    return DEFAULT_LLM_MODEL
+
+
+@CrewBase
+class LeadGeneratorCrew():
+    """LeadGenerator crew"""
+    agents_config = 'config/agents.yaml'
+    tasks_config = 'config/tasks.yaml'
+    
+    @agent
+    def lead_generator(self) -> Agent:
+        return Agent(
+            config=self.agents_config['lead_generator'],
+            llm=agent_llm(),
+            tools=[search_tool, scrape_tool],
+            verbose=True
+        )
+    
+    @agent
+    def contact_agent(self) -> Agent:
+        return Agent(
+            config=self.agents_config['contact_agent'],
+            llm=agent_llm(),
+            tools=[search_tool, scrape_tool, batch_scrape_tool],
+            verbose=True
+        )
+    
+    @agent 
+    def lead_qualifier(self) -> Agent:
+        return Agent(
+            config=self.agents_config['lead_qualifier'],
+            llm=agent_llm(),
+            verbose=True
+        )	
+    
+    @agent
+    def sales_manager(self) -> Agent:
+        return Agent(
+            config=self.agents_config['sales_manager'],
+            llm=agent_llm(),
+            tools=[],
+            verbose=True
+        )	
+    
+    @task
+    def lead_generation_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['lead_generation_task'],
+            output_pydantic=LeadOutput
+        )
+    
+    @task
+    def contact_research_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['contact_research_task'],
+            context=[self.lead_generation_task()],
+            # Roda em paralelo com a qualificação; a sales_management_task aguarda ambas
+            async_execution=True,
+        )
+    
+    @task
+    def lead_qualification_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['lead_qualification_task'],
+            context=[self.lead_generation_task()],
+            output_pydantic=LeadOutput,
+            # Também assíncrona: uma task síncrona aguardaria a contact_research_task terminar
+            async_execution=True,
+        )
+    
+    @task
+    def sales_management_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['sales_management_task'],
+            context=[self.lead_generation_task(), self.lead_qualification_task(), self.contact_research_task()],
+            output_pydantic=LeadOutput
+        )
+    
+    @crew
+    def crew(self) -> Crew:
+        """Creates the LeadGenerator crew"""
+        return Crew(
+            agents=self.agents,
+            tasks=self.tasks,
+            process=Process.sequential,
+            verbose=True,
+            cache=True,
+            usage_metrics={}
+        )
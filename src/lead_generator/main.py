@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import json
 import sys
 import warnings
 
@@ -28,6 +29,23 @@ def run():
         raise Exception(f"An error occurred while running the crew: {e}")
 
 
+def run_batch():
+    """
+    Run one crew per input set, concurrently.
+    Reads a JSON file with a list of inputs, e.g. [{"industry": "Fintech", "country": "Brazil"}].
+    """
+    with open(sys.argv[1]) as f:
+        inputs_list = json.load(f)
+
+    try:
+        results = LeadGenerator().run_batch(inputs_list)
+    except Exception as e:
+        raise Exception(f"An error occurred while running the batch: {e}")
+
+    for inputs, result in zip(inputs_list, results):
+        print(f"\n### {inputs}\n{result}")
+
+
 def train():
     """
     Train the crew for a given number of iterations.
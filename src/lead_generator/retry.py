@@ -0,0 +1,48 @@
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_WAIT = 30
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Retorna True para timeouts e respostas 429/5xx de Serper ou do provedor do LLM"""
+    if isinstance(exc, TimeoutError) or "Timeout" in type(exc).__name__:
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in RETRYABLE_STATUS_CODES
+
+
+_jitter = wait_random_exponential(min=1, max=MAX_WAIT)
+
+
+def wait_retry_after(retry_state: RetryCallState) -> float:
+    """Respeita o header Retry-After quando presente; senão usa backoff exponencial com jitter"""
+    exc = retry_state.outcome.exception()
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return min(float(headers.get("retry-after")), MAX_WAIT)
+    except (TypeError, ValueError):
+        return _jitter(retry_state)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    print(f"Falha transitória ao executar crew (tentativa {retry_state.attempt_number}): "
+          f"{retry_state.outcome.exception()}")
+
+
+# Repete a chamada em falhas transitórias; após a última tentativa a exceção original é propagada
+retry_transient = retry(
+    wait=wait_retry_after,
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception(is_transient_error),
+    before_sleep=_log_retry,
+    reraise=True,
+)
@@ -0,0 +1,106 @@
+import asyncio
+import re
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, ClassVar, List, Type, Union
+
+import aiohttp
+import httpx
+from bs4 import BeautifulSoup
+from crewai.tools import BaseTool
+from crewai_tools import ScrapeWebsiteTool
+from pydantic import BaseModel, Field
+
+
+def parse_page(html: Union[str, bytes]) -> str:
+    """Extract the readable text of a page, as ScrapeWebsiteTool does.
+
+    Raw bytes are decoded by BeautifulSoup, which detects the encoding from
+    the page itself when the server does not declare a charset.
+    """
+    parsed = BeautifulSoup(html, "html.parser")
+
+    text = parsed.get_text(" ")
+    text = re.sub("[ \t]+", " ", text)
+    text = re.sub("\\s+\n\\s+", "\n", text)
+    return text
+
+
+class PooledScrapeTool(ScrapeWebsiteTool):
+    """ScrapeWebsiteTool that reuses pooled keep-alive connections.
+
+    The stock tool opens a new connection (TCP + TLS handshake) for every
+    URL. All instances of this tool share one HTTP/2 client instead, so
+    repeated scrapes of the same host reuse the connection.
+
+    The shared client never stores cookies, so Set-Cookie values from one
+    scrape are not sent on later ones; the configured cookies are sent as
+    a Cookie header on each request instead.
+    """
+
+    client: ClassVar[httpx.Client] = httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        timeout=15.0,
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    )
+
+    def _run(self, **kwargs: Any) -> Any:
+        website_url = kwargs.get("website_url", self.website_url)
+        headers = dict(self.headers)
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        page = self.client.get(website_url, headers=headers)
+
+        # Without a declared charset httpx would assume UTF-8; let the parser detect it
+        html = page.text if page.charset_encoding else page.content
+        return "The following text is scraped website content:\n\n" + parse_page(html)
+
+
+class AsyncScrapeToolSchema(BaseModel):
+    """Input for AsyncScrapeTool."""
+
+    urls: List[str] = Field(..., description="List of website URLs to read in a single call")
+
+
+class AsyncScrapeTool(BaseTool):
+    """Scrape several websites concurrently with aiohttp.
+
+    Useful when a lead needs its website and LinkedIn pages read together:
+    the total wait is that of the slowest page instead of the sum of all.
+    """
+
+    name: str = "Read multiple websites' content"
+    description: str = "A tool that can be used to read the content of several websites at once."
+    args_schema: Type[BaseModel] = AsyncScrapeToolSchema
+    max_concurrency: int = 20
+    headers: dict = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
+    def _run(self, urls: List[str]) -> str:
+        return asyncio.run(self._scrape_all(urls))
+
+    async def _scrape_all(self, urls: List[str]) -> str:
+        # Each call runs in its own event loop, so the session lives only for this batch
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=15)
+
+        async with aiohttp.ClientSession(timeout=timeout, headers=self.headers) as session:
+            async def scrape(url: str) -> str:
+                async with semaphore:
+                    async with session.get(url) as response:
+                        # Error pages (404, 403, 5xx) are reported as failures, not as content
+                        response.raise_for_status()
+                        return parse_page(await response.text())
+
+            pages = await asyncio.gather(*[scrape(url) for url in urls], return_exceptions=True)
+
+        sections = []
+        for url, page in zip(urls, pages):
+            if isinstance(page, Exception):
+                page = f"Could not read this website: {page}"
+            sections.append(f"The following text is scraped content of {url}:\n\n{page}")
+        return "\n\n".join(sections)
@@ -0,0 +1,33 @@
+import hashlib
+from typing import Any, ClassVar
+
+import diskcache
+from crewai_tools import SerperDevTool
+
+SEARCH_CACHE_TTL = 24 * 60 * 60  # 24 horas
+
+
+class CachedSerperTool(SerperDevTool):
+    """SerperDevTool that keeps search results in a disk cache.
+
+    Identical queries (with the same search settings) are answered from the
+    cache for 24 hours instead of calling the Serper API again.
+    """
+
+    cache: ClassVar[diskcache.Cache] = diskcache.Cache("./.serper_cache")
+
+    def _cache_key(self, query: str) -> str:
+        settings = (query, self.search_type, self.n_results, self.country, self.location, self.locale)
+        return hashlib.blake2b(repr(settings).encode()).hexdigest()
+
+    def _run(self, **kwargs: Any) -> Any:
+        query = kwargs.get("search_query") or kwargs.get("query")
+        if not query:
+            return super()._run(**kwargs)
+
+        key = self._cache_key(query)
+        results = self.cache.get(key)
+        if results is None:
+            results = super()._run(**kwargs)
+            self.cache.set(key, results, expire=SEARCH_CACHE_TTL)
+        return results
@@ -0,0 +1,18 @@
+from typing import Any, List
+
+import msgspec
+
+# Leads are plain dicts from the LLM: missing, extra and explicitly null fields
+# are all kept as-is, so they are encoded directly instead of through a Struct
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(List[Any])
+
+
+def encode_leads(leads: List[Any]) -> bytes:
+    """Encode a list of lead dicts as msgpack bytes"""
+    return _encoder.encode(leads)
+
+
+def decode_leads(data: bytes) -> List[Any]:
+    """Decode msgpack bytes back into a list of lead dicts"""
+    return _decoder.decode(data)